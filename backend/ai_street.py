@@ -10,13 +10,13 @@ CSV export support shared with the desktop runtime.
 from __future__ import annotations
 
 import argparse
+import csv
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
-import pandas as pd
 from transformers.utils import logging as hf_logging
 
 from .llocale import (
@@ -102,6 +102,15 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default="auto",
         help="Device to run predictions on (default: auto-detect CUDA/ROCm).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=["torch", "onnx"],
+        default="torch",
+        help=(
+            "Inference engine for the image encoder (default: torch). "
+            "'onnx' requires onnxruntime and falls back to torch if unavailable."
+        ),
+    )
     parser.add_argument(
         "--hf-cache",
         type=Path,
@@ -136,33 +145,49 @@ def prepare_records(args: argparse.Namespace) -> List[InputRecord]:
     )
 
 
-def write_csv(path: Path, outcomes: Iterable[PredictionOutcome]) -> None:
-    rows = []
-    for outcome in outcomes:
-        if not outcome.predictions:
-            continue
-        for prediction in outcome.predictions:
-            rows.append(
-                {
-                    "path": str(outcome.record.path),
-                    "md5": outcome.record.md5 or "",
-                    "prediction_number": prediction.rank,
-                    "latitude": prediction.latitude,
-                    "longitude": prediction.longitude,
-                    "probability": prediction.probability,
-                    "city": prediction.city,
-                    "state": prediction.state,
-                    "county": prediction.county,
-                    "country": prediction.country,
-                }
-            )
-    ensure_output_directory(path)
-    pd.DataFrame(rows).to_csv(
-        path,
-        index=False,
-        float_format='%.10f',  # 10 decimal places for lat/lon precision
-        encoding='utf-8'
-    )
+CSV_HEADER = (
+    "path",
+    "md5",
+    "prediction_number",
+    "latitude",
+    "longitude",
+    "probability",
+    "city",
+    "state",
+    "county",
+    "country",
+)
+
+
+# Bound method cached once (same trick as _format_table_row below); f-strings
+# re-parse the format spec on every row, which adds up in million-row exports.
+_format_csv_float = "{:.10f}".format
+
+
+def csv_rows(outcome: PredictionOutcome) -> Iterator[Tuple]:
+    """Yield CSV rows for a single outcome (one row per prediction)."""
+    for prediction in outcome.predictions:
+        yield (
+            outcome.record.path_str,
+            outcome.record.md5 or "",
+            prediction.rank,
+            _format_csv_float(prediction.latitude),  # 10 decimal places for lat/lon precision
+            _format_csv_float(prediction.longitude),
+            _format_csv_float(prediction.probability),
+            prediction.city,
+            prediction.state,
+            prediction.county,
+            prediction.country,
+        )
+
+
+TABLE_HEADER = (
+    "  Rank  Latitude     Longitude    Probability  Location\n"
+    "  ----  --------     ----------   -----------  --------\n"
+)
+
+# Bound method cached once; skips re-parsing the format spec per row.
+_format_table_row = "  {:>4}  {:>9.6f}  {:>11.6f}  {:>11.6f}  {}\n".format
 
 
 def print_table(
@@ -171,31 +196,26 @@ def print_table(
     quiet: bool,
     log_handle: Optional[object],
 ) -> None:
-    header_line = "  Rank  Latitude     Longitude    Probability  Location"
-    underline = "  ----  --------     ----------   -----------  --------"
-    if not quiet:
-        print(header_line)
-        print(underline)
-    if log_handle:
-        log_handle.write(header_line + "\n")
-        log_handle.write(underline + "\n")
-
-    for prediction in outcome.predictions:
-        location_display = prediction.location_summary or "-"
-        line = (
-            f"  {prediction.rank:>4}  {prediction.latitude:>9.6f}  "
-            f"{prediction.longitude:>11.6f}  {prediction.probability:>11.6f}  "
-            f"{location_display}"
+    # Build the whole table once and emit it with a single write per sink;
+    # per-line print/write calls cost a syscall each on 10k-image runs.
+    parts = [TABLE_HEADER]
+    parts.extend(
+        _format_table_row(
+            prediction.rank,
+            prediction.latitude,
+            prediction.longitude,
+            prediction.probability,
+            prediction.location_summary or "-",
         )
-        if not quiet:
-            print(line)
-        if log_handle:
-            log_handle.write(line + "\n")
+        for prediction in outcome.predictions
+    )
+    parts.append("\n")
+    table = "".join(parts)
 
     if not quiet:
-        print("")
+        sys.stdout.write(table)
     if log_handle:
-        log_handle.write("\n")
+        log_handle.write(table)
 
 
 def run_predictions(
@@ -207,13 +227,15 @@ def run_predictions(
     quiet: bool,
     log_file: Optional[Path],
     show_progress: bool,
-) -> Tuple[int, List[PredictionOutcome]]:
+    csv_path: Optional[Path] = None,
+    engine: str = "torch",
+) -> int:
     total = len(records)
     if total == 0:
         print("No inputs found. Exiting.", file=sys.stderr)
         return 1
 
-    predictor = GeoClipPredictor(device=device)
+    predictor = GeoClipPredictor(device=device, engine=engine)
     print(f"Using device: {predictor.device_label}", file=sys.stderr)
 
     log_handle = None
@@ -225,6 +247,16 @@ def run_predictions(
             print(f"Warning: Failed to open log file: {e}", file=sys.stderr)
             # Continue without file logging
 
+    # Stream rows to the CSV while iterating instead of materializing every
+    # outcome; keeps memory flat on large runs and skips pandas entirely.
+    csv_handle = None
+    csv_writer = None
+    if csv_path:
+        ensure_output_directory(csv_path)
+        csv_handle = csv_path.open("w", newline="", encoding="utf-8")
+        csv_writer = csv.writer(csv_handle)
+        csv_writer.writerow(CSV_HEADER)
+
     progress_bar = None
     if show_progress and total > 1:
         from tqdm import tqdm
@@ -232,7 +264,6 @@ def run_predictions(
         progress_bar = tqdm(total=total, unit="img", desc="Predicting", leave=False)
 
     failures = 0
-    outcomes: List[PredictionOutcome] = []
 
     try:
         for outcome in predictor.predict_records(records, top_k=top_k, skip_missing=skip_missing):
@@ -268,7 +299,8 @@ def run_predictions(
                 print_table(outcome, quiet=quiet, log_handle=log_handle)
             # Missing files with --skip-missing land here with warnings but no error and no predictions.
 
-            outcomes.append(outcome)
+            if csv_writer:
+                csv_writer.writerows(csv_rows(outcome))
 
             if progress_bar:
                 progress_bar.update(1)
@@ -278,11 +310,20 @@ def run_predictions(
                 log_handle.close()
             except Exception as e:
                 print(f"Warning: Failed to close log file: {e}", file=sys.stderr)
+        if csv_handle:
+            try:
+                csv_handle.close()
+            except Exception as e:
+                print(f"Warning: Failed to close CSV file: {e}", file=sys.stderr)
         if progress_bar:
             progress_bar.close()
 
-    return_code = 0 if failures == 0 else 1
-    return return_code, outcomes
+    # Reported here rather than in main(): the early no-input exit above
+    # returns before the CSV is ever opened, and the caller can't tell.
+    if csv_writer is not None:
+        print(f"Saved predictions to '{csv_path}'.")
+
+    return 0 if failures == 0 else 1
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -296,7 +337,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     cache_root = args.hf_cache.expanduser().resolve() if args.hf_cache else None
     set_hf_cache_environment(cache_root)
 
-    exit_code, outcomes = run_predictions(
+    exit_code = run_predictions(
         records,
         top_k=args.top_k,
         skip_missing=args.skip_missing,
@@ -304,12 +345,10 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         quiet=args.quiet,
         log_file=args.log_file,
         show_progress=args.progress,
+        csv_path=args.output_csv if args.write_csv else None,
+        engine=args.engine,
     )
 
-    if args.write_csv:
-        write_csv(args.output_csv, outcomes)
-        print(f"Saved predictions to '{args.output_csv}'.")
-
     duration = time.perf_counter() - start_time
     print(f"Completed in {duration:.2f} seconds with exit code {exit_code}.")
     return exit_code
@@ -5,13 +5,17 @@ FastAPI service that exposes GeoCLIP inference powered by the shared runtime in
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 from .llocale import (
@@ -19,6 +23,7 @@ from .llocale import (
     InputRecord,
     LocationPrediction,
     PredictionOutcome,
+    select_device,
     set_hf_cache_environment,
 )
 
@@ -26,7 +31,7 @@ from .llocale import (
 logger = logging.getLogger(__name__)
 
 # Security: Define allowed image extensions to prevent processing of arbitrary files
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'}
+ALLOWED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'})
 
 # Security: Maximum number of images per request to prevent resource exhaustion
 MAX_IMAGES_PER_REQUEST = 100
@@ -37,16 +42,30 @@ DeviceChoice = Literal["auto", "cpu", "cuda", "rocm"]
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Application lifespan for database initialization."""
-    from services.database import init_db
+    """Application lifespan for database and upload-dir initialization."""
+    from .config import settings
+    from .services.database import init_db
+    # Create the upload directory once at startup instead of per request.
+    settings.upload_dir.mkdir(parents=True, exist_ok=True)
     await init_db()
     yield
 
 
-app = FastAPI(title="LLocale GeoCLIP Service", version="0.1.0", lifespan=lifespan)
+# orjson serializes the float-heavy prediction payloads ~5x faster than
+# stdlib json.
+app = FastAPI(
+    title="LLocale GeoCLIP Service",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Prediction payloads are repetitive JSON that gzips 5-10x; level 1 keeps
+# the CPU cost negligible while cutting transfer time for remote clients.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 # Include jobs router for shared workspace
-from api.jobs import router as jobs_router
+from .api.jobs import router as jobs_router
 app.include_router(jobs_router, prefix="/api/jobs", tags=["jobs"])
 
 # Include audit log routes
@@ -54,7 +73,7 @@ import sys
 sys.path.insert(0, "/app")  # Add parent for shared imports
 try:
     from shared.api.audit import create_audit_router
-    from services.database import get_session
+    from .services.database import get_session
     audit_router = create_audit_router(get_session)
     app.include_router(audit_router, prefix="/api/audit", tags=["audit"])
 except ImportError:
@@ -109,7 +128,9 @@ class PredictionCandidateResponse(BaseModel):
 
     @classmethod
     def from_prediction(cls, prediction: LocationPrediction) -> "PredictionCandidateResponse":
-        return cls(
+        # model_construct skips the validation pass; the predictor already
+        # produced well-typed values and a big request builds 500 of these.
+        return cls.model_construct(
             rank=prediction.rank,
             latitude=prediction.latitude,
             longitude=prediction.longitude,
@@ -123,7 +144,7 @@ class PredictionCandidateResponse(BaseModel):
 
 
 class PredictionResultResponse(BaseModel):
-    path: Path
+    path: str  # Use string instead of Path for JSON serialization
     md5: Optional[str]
     predictions: List[PredictionCandidateResponse]
     warnings: List[str]
@@ -131,8 +152,8 @@ class PredictionResultResponse(BaseModel):
 
     @classmethod
     def from_outcome(cls, outcome: PredictionOutcome) -> "PredictionResultResponse":
-        return cls(
-            path=outcome.record.path,
+        return cls.model_construct(
+            path=outcome.record.path_str,
             md5=outcome.record.md5,
             predictions=[
                 PredictionCandidateResponse.from_prediction(pred) for pred in outcome.predictions
@@ -147,6 +168,50 @@ class InferenceResponse(BaseModel):
     results: List[PredictionResultResponse]
 
 
+@lru_cache(maxsize=4096)
+def _validate_cached(path_str: str, mtime_ns: int) -> Path:
+    """Validation body, cached per (path, mtime) by validate_image_path."""
+    path = Path(path_str)
+
+    # Resolve to absolute path (follows symlinks and removes .. components)
+    resolved_path = path.resolve()
+
+    # Security: Ensure path is absolute to prevent traversal attacks
+    if not resolved_path.is_absolute():
+        logger.warning(f"Rejected non-absolute path: {path.name}")
+        raise HTTPException(
+            status_code=400,
+            detail=f"Path must be absolute: {path.name}"
+        )
+
+    # Security: Validate file exists and is a regular file
+    if not resolved_path.is_file():
+        logger.warning(f"File not found or not a regular file: {resolved_path.name}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"File not found: {resolved_path.name}"
+        )
+
+    # Security: Validate file extension (defense in depth). rfind on the name
+    # is cheaper than PurePath.suffix, which re-parses the path.
+    name = resolved_path.name
+    dot = name.rfind('.')
+    file_extension = name[dot:].lower() if dot >= 0 else ''
+    if file_extension not in ALLOWED_EXTENSIONS:
+        logger.warning(
+            f"Rejected unsupported file type '{file_extension}': {resolved_path.name}"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Unsupported file type '{file_extension}'. "
+                f"Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+            )
+        )
+
+    return resolved_path
+
+
 def validate_image_path(path: Path) -> Path:
     """
     Security: Validate image path to prevent path traversal and ensure file safety.
@@ -156,6 +221,10 @@ def validate_image_path(path: Path) -> Path:
     - File must exist and be a regular file (not directory or special file)
     - Extension must be in the allowed list (defense in depth)
 
+    Re-validating an unchanged file (dashboard polls, re-runs) is cached on
+    (path, mtime_ns), so repeat calls cost one stat instead of the full
+    expanduser/resolve/is_file syscall chain.
+
     Args:
         path: The path to validate
 
@@ -166,44 +235,18 @@ def validate_image_path(path: Path) -> Path:
         HTTPException: If validation fails
     """
     try:
-        # Resolve to absolute path (follows symlinks and removes .. components)
-        resolved_path = path.expanduser().resolve()
-
-        # Security: Ensure path is absolute to prevent traversal attacks
-        if not resolved_path.is_absolute():
-            logger.warning(f"Rejected non-absolute path: {path.name}")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Path must be absolute: {path.name}"
-            )
-
-        # Security: Validate file exists and is a regular file
-        if not resolved_path.is_file():
-            logger.warning(f"File not found or not a regular file: {resolved_path.name}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"File not found: {resolved_path.name}"
-            )
-
-        # Security: Validate file extension (defense in depth)
-        file_extension = resolved_path.suffix.lower()
-        if file_extension not in ALLOWED_EXTENSIONS:
-            logger.warning(
-                f"Rejected unsupported file type '{file_extension}': {resolved_path.name}"
-            )
-            raise HTTPException(
-                status_code=400,
-                detail=(
-                    f"Unsupported file type '{file_extension}'. "
-                    f"Allowed extensions: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
-                )
-            )
-
-        return resolved_path
-
+        expanded = path.expanduser()
+        mtime_ns = expanded.stat().st_mtime_ns
+        return _validate_cached(str(expanded), mtime_ns)
     except HTTPException:
         # Re-raise HTTPExceptions as-is
         raise
+    except FileNotFoundError:
+        logger.warning(f"File not found: {path.name}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"File not found: {path.name}"
+        )
     except Exception as e:
         # Security: Log full error but only return filename to client
         logger.error(f"Path validation error for {path.name}: {e}")
@@ -214,25 +257,27 @@ def validate_image_path(path: Path) -> Path:
 
 
 @lru_cache(maxsize=3)
-def get_predictor(device: DeviceChoice) -> GeoClipPredictor:
+def _predictor_for(device: str) -> GeoClipPredictor:
     return GeoClipPredictor(device=device)
 
 
+def get_predictor(device: DeviceChoice) -> GeoClipPredictor:
+    # Resolve "auto" to its concrete device before the cache lookup so auto
+    # and explicit-device requests share one predictor (the model weights are
+    # already shared at the llocale level).
+    _, resolved = select_device(device)
+    return _predictor_for(resolved)
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
 
 
-@app.post("/infer", response_model=InferenceResponse)
-def infer(request: InferenceRequest) -> InferenceResponse:
-    """
-    Perform geolocation inference on a batch of images.
+async def _validated_records(request: InferenceRequest) -> List[InputRecord]:
+    """Validate every requested path and build the InputRecords.
 
-    Security validations:
-    - Request size limited to MAX_IMAGES_PER_REQUEST
-    - All paths validated for traversal attacks
-    - File extensions verified against allowlist
-    - Error messages sanitized to prevent information disclosure
+    Shared by the buffered and streaming inference endpoints.
     """
     if not request.items:
         raise HTTPException(status_code=400, detail="No items provided for inference.")
@@ -241,18 +286,26 @@ def infer(request: InferenceRequest) -> InferenceResponse:
         set_hf_cache_environment(request.hf_cache.expanduser().resolve())
 
     # Security: Validate all image paths BEFORE processing
-    # This prevents path traversal attacks and ensures only valid image files are processed
+    # This prevents path traversal attacks and ensures only valid image files
+    # are processed. Validation stats run on the thread pool in parallel so a
+    # 100-image batch doesn't serialize its syscalls on the event loop.
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(validate_image_path, item.path) for item in request.items),
+        return_exceptions=True,
+    )
+
     validated_paths = []
-    for item in request.items:
-        try:
-            validated_path = validate_image_path(item.path)
-            validated_paths.append((validated_path, item.md5))
-        except HTTPException as e:
+    for item, outcome in zip(request.items, outcomes):
+        if isinstance(outcome, HTTPException):
             # Security: If validation fails and skip_missing is False, fail fast
             if not request.skip_missing:
-                raise
+                raise outcome
             # Otherwise, log the error and continue with next item
-            logger.info(f"Skipping invalid path: {item.path.name} - {e.detail}")
+            logger.info(f"Skipping invalid path: {item.path.name} - {outcome.detail}")
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            validated_paths.append((outcome, item.md5))
 
     if not validated_paths:
         raise HTTPException(
@@ -260,25 +313,51 @@ def infer(request: InferenceRequest) -> InferenceResponse:
             detail="No valid image files found after security validation."
         )
 
-    # Create InputRecords with validated paths
-    records = [
+    return [
         InputRecord(index=i + 1, path=path, md5=md5)
         for i, (path, md5) in enumerate(validated_paths)
     ]
 
+
+# No response_model: the decorator would re-validate every field of the
+# returned object, undoing the model_construct fast path below. The schema
+# stays in the OpenAPI docs via `responses`.
+@app.post("/infer", responses={200: {"model": InferenceResponse}})
+async def infer(request: InferenceRequest) -> ORJSONResponse:
+    """
+    Perform geolocation inference on a batch of images.
+
+    Security validations:
+    - Request size limited to MAX_IMAGES_PER_REQUEST
+    - All paths validated for traversal attacks
+    - File extensions verified against allowlist
+    - Error messages sanitized to prevent information disclosure
+    """
+    records = await _validated_records(request)
+
     try:
         predictor = get_predictor(request.device)
-        outcomes = list(
-            predictor.predict_records(
-                records,
-                top_k=request.top_k,
-                skip_missing=request.skip_missing,
+        # Run inference on the thread pool: PyTorch releases the GIL inside
+        # the model, and the long-running batch must not block the event loop
+        # for /health and the jobs endpoints.
+        outcomes = await asyncio.to_thread(
+            lambda: list(
+                predictor.predict_records(
+                    records,
+                    top_k=request.top_k,
+                    skip_missing=request.skip_missing,
+                )
             )
         )
 
-        return InferenceResponse(
-            device=predictor.device_label,
-            results=[PredictionResultResponse.from_outcome(outcome) for outcome in outcomes],
+        return ORJSONResponse(
+            {
+                "device": predictor.device_label,
+                "results": [
+                    PredictionResultResponse.from_outcome(outcome).model_dump()
+                    for outcome in outcomes
+                ],
+            }
         )
     except Exception as e:
         # Security: Log full error but sanitize response to prevent information disclosure
@@ -287,3 +366,27 @@ def infer(request: InferenceRequest) -> InferenceResponse:
             status_code=500,
             detail="Inference processing failed. Check server logs for details."
         )
+
+
+@app.post("/infer/stream")
+async def infer_stream(request: InferenceRequest) -> StreamingResponse:
+    """
+    Perform geolocation inference and stream results as NDJSON.
+
+    One line per image, emitted as soon as its batch finishes: first-byte
+    latency equals first-image inference time and server memory stays O(1)
+    instead of buffering the whole response. Same validation as /infer.
+    """
+    records = await _validated_records(request)
+    predictor = get_predictor(request.device)
+
+    def outcome_lines():
+        # Plain generator: Starlette iterates sync generators on the thread
+        # pool, so the model never runs on the event loop.
+        for outcome in predictor.predict_records(
+            records, top_k=request.top_k, skip_missing=request.skip_missing
+        ):
+            result = PredictionResultResponse.from_outcome(outcome)
+            yield orjson.dumps(result.model_dump(), default=str) + b"\n"
+
+    return StreamingResponse(outcome_lines(), media_type="application/x-ndjson")
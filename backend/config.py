@@ -38,6 +38,29 @@ CORS_ORIGINS = [
 ]
 
 # Security settings
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'}
+ALLOWED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'})
 MAX_IMAGES_PER_REQUEST = 100
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB per file
+
+
+class _Settings:
+    """Attribute-style view over the module constants above.
+
+    The API routes and workers import this as `settings`; keeping it a thin
+    namespace means every value is still defined (and env-resolved) exactly
+    once at module import.
+    """
+
+    database_url = DATABASE_URL
+    redis_url = REDIS_URL
+    upload_dir = UPLOAD_DIR
+    hf_home = HF_HOME
+    hf_token = HF_TOKEN
+    device = DEVICE
+    cors_origins = CORS_ORIGINS
+    allowed_extensions = ALLOWED_EXTENSIONS
+    max_images_per_request = MAX_IMAGES_PER_REQUEST
+    max_file_size = MAX_FILE_SIZE
+
+
+settings = _Settings()
@@ -12,5 +12,6 @@ from .predictor import (  # noqa: F401
     ensure_output_directory,
     load_records_from_path,
     normalise_extensions,
+    select_device,
     set_hf_cache_environment,
 )
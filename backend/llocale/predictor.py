@@ -9,73 +9,85 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
-from functools import lru_cache, wraps
+from functools import wraps
 from pathlib import Path
 from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
 
+import numpy as np
 import pandas as pd
 import reverse_geocode
 import torch
 from geoclip import GeoCLIP
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
+# Number of images preprocessed and pushed through the model per forward pass.
+# Batching amortises kernel-launch and host-to-device transfer overhead that
+# dominates when images are fed to the GPU one at a time.
+DEFAULT_BATCH_SIZE = 16
+
+# CUDA streams used to pipeline large batches; one chunk computes while
+# another's transfer/launch overhead is absorbed on a second stream.
+NUM_CUDA_STREAMS = 2
+
+
+# Shared workers for with_timeout: spawning a fresh thread per call costs
+# tens of microseconds of clone/stack/TLS setup, which dwarfs a cached
+# geocode lookup. Idle workers park on a condition variable instead.
+_TIMEOUT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llocale-timeout")
+
 
 def with_timeout(timeout_seconds: float) -> Callable:
-    """Decorator to add timeout protection to a function using threading.
+    """Decorator to add timeout protection to a function via a shared thread pool.
 
     If the function doesn't complete within timeout_seconds, returns None and logs a warning.
     This prevents slow/hanging reverse geocoding lookups from blocking the pipeline.
+    As with the thread-per-call approach this replaces, a timed-out worker
+    cannot be killed — it keeps running and its result is discarded.
     """
     def decorator(func: Callable[..., T]) -> Callable[..., Optional[T]]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Optional[T]:
-            import threading
-            result = [None]
-            exception = [None]
-
-            def target():
-                try:
-                    result[0] = func(*args, **kwargs)
-                except Exception as e:
-                    exception[0] = e
-
-            thread = threading.Thread(target=target, daemon=True)
-            thread.start()
-            thread.join(timeout=timeout_seconds)
-
-            if thread.is_alive():
+            future = _TIMEOUT_POOL.submit(func, *args, **kwargs)
+            try:
+                return future.result(timeout=timeout_seconds)
+            except FutureTimeoutError:
+                future.cancel()
                 logger.warning(f"{func.__name__} timed out after {timeout_seconds}s with args={args[:2]}")
                 return None
-
-            if exception[0]:
-                raise exception[0]
-
-            return result[0]
         return wrapper
     return decorator
 
 
-@dataclass
+@dataclass(slots=True)
 class InputRecord:
     """Represents a single prediction request."""
 
     index: int
     path: Path
     md5: Optional[str] = None
+    # str(path) computed once; the hot loop needs the string form for the
+    # model call and log messages, and repeated Path.__str__ calls add up.
+    path_str: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.path_str = str(self.path)
 
     def banner(self, total: int) -> str:
         base = f"{self.index}/{total}"
         parts = [base]
         if self.md5:
             parts.append(self.md5)
-        parts.append(str(self.path))
+        parts.append(self.path_str)
         return " :: ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationPrediction:
     """Single ranked prediction for a record."""
 
@@ -87,20 +99,20 @@ class LocationPrediction:
     state: str
     county: str
     country: str
-
-    @property
-    def location_summary(self) -> str:
-        parts = [
-            self.city or "",
-            self.state or "",
-            self.county or "",
-            self.country or "",
-        ]
-        filtered = [part for part in parts if part]
-        return ", ".join(filtered)
+    # Joined once at construction; the summary is re-read in the table,
+    # CSV, and API serialization loops, so the property rebuilt (and
+    # re-filtered) the same string on every access.
+    location_summary: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.location_summary = ", ".join(
+            part
+            for part in (self.city, self.state, self.county, self.country)
+            if part
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class PredictionOutcome:
     """Result of attempting to predict a single record."""
 
@@ -129,61 +141,108 @@ def load_records_from_csv(
     md5_column: str,
 ) -> List[InputRecord]:
     """Load prediction requests from a CSV manifest."""
+    # Prefer the multithreaded pyarrow parser; we only need string columns so
+    # dtype inference is skipped outright. Malformed manifests (or a missing
+    # pyarrow install) fall back to the tolerant python engine.
     try:
         df = pd.read_csv(
             csv_path,
             delimiter=delimiter,
-            on_bad_lines='warn',
-            engine='python'
+            engine='pyarrow',
+            dtype=str,
         )
-    except Exception as exc:  # pragma: no cover - diagnostic path
-        raise RuntimeError(f"Failed to read CSV '{csv_path}': {exc}") from exc
+    except Exception:
+        try:
+            df = pd.read_csv(
+                csv_path,
+                delimiter=delimiter,
+                on_bad_lines='warn',
+                engine='python'
+            )
+        except Exception as exc:  # pragma: no cover - diagnostic path
+            raise RuntimeError(f"Failed to read CSV '{csv_path}': {exc}") from exc
 
     if df.empty:
         raise ValueError(f"CSV file is empty or failed to parse: {csv_path}")
 
-    records: List[InputRecord] = []
-    for idx, row in df.iterrows():
-        path_value = None
-
-        if path_column in df.columns:
-            path_value = row[path_column]
-        elif len(row) > 0:
-            path_value = row.iloc[-1]
-
-        if path_value is None or (isinstance(path_value, float) and pd.isna(path_value)):
-            raise ValueError(
-                f"Row {idx + 1} in '{csv_path}' is missing a valid path value."
-            )
-
-        if md5_column in df.columns:
-            md5_candidate = row[md5_column]
-        elif len(row) > 1:
-            md5_candidate = row.iloc[0]
-        else:
-            md5_candidate = None
-
-        md5_value: Optional[str]
-        if md5_candidate is not None and not (isinstance(md5_candidate, float) and pd.isna(md5_candidate)):
-            md5_value = str(md5_candidate)
-        else:
-            md5_value = None
+    # Column-wise extraction instead of df.iterrows(): the per-row loop paid
+    # Python dispatch and NaN checks per cell, which dominates on large
+    # manifests.
+    if path_column in df.columns:
+        path_values = df[path_column]
+    else:
+        path_values = df.iloc[:, -1]
+
+    missing_mask = path_values.isna()
+    if missing_mask.any():
+        first_missing = int(missing_mask.to_numpy().argmax())
+        raise ValueError(
+            f"Row {first_missing + 1} in '{csv_path}' is missing a valid path value."
+        )
 
-        resolved_path = Path(str(path_value)).expanduser()
-        if not resolved_path.is_absolute():
-            resolved_path = (csv_path.parent / resolved_path).resolve()
+    if md5_column in df.columns:
+        md5_values = df[md5_column]
+    elif df.shape[1] > 1:
+        md5_values = df.iloc[:, 0]
+    else:
+        md5_values = None
+
+    md5_list: List[Optional[str]]
+    if md5_values is not None:
+        md5_list = [
+            None if value is None else str(value)
+            for value in md5_values.where(md5_values.notna(), None).tolist()
+        ]
+    else:
+        md5_list = [None] * len(df)
 
+    # Anchor the manifest directory once; per-row os.path.abspath would
+    # re-query the working directory for every relative path.
+    base_dir = os.path.abspath(str(csv_path.parent))
+    records: List[InputRecord] = []
+    for idx, (raw_path, md5_value) in enumerate(
+        zip(path_values.astype(str).tolist(), md5_list)
+    ):
+        resolved = os.path.expanduser(raw_path)
+        if not os.path.isabs(resolved):
+            resolved = os.path.normpath(os.path.join(base_dir, resolved))
         records.append(
-            InputRecord(
-                index=idx + 1,
-                path=resolved_path,
-                md5=md5_value,
-            )
+            InputRecord(index=idx + 1, path=Path(resolved), md5=md5_value)
         )
 
     return records
 
 
+def _scan_image_files(
+    root: str,
+    *,
+    recursive: bool,
+    allowed_suffixes: Optional[Tuple[str, ...]],
+) -> Iterator[str]:
+    """Walk ``root`` with os.scandir, yielding matching file paths as strings.
+
+    DirEntry caches the stat result from the directory read, so filtering
+    avoids the extra stat-per-path that Path.is_file()/rglob incur on large
+    trees. The suffix filter is a single str.endswith over a tuple — one
+    C-level pass per name, no rpartition tuple or f-string allocation, and
+    extension-less names simply fail the match.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _scan_image_files(
+                        entry.path,
+                        recursive=recursive,
+                        allowed_suffixes=allowed_suffixes,
+                    )
+                continue
+            if not entry.is_file():
+                continue
+            if allowed_suffixes is None or entry.name.lower().endswith(allowed_suffixes):
+                yield entry.path
+
+
 def load_records_from_directory(
     directory: Path,
     *,
@@ -196,20 +255,19 @@ def load_records_from_directory(
     if not directory.is_dir():
         raise NotADirectoryError(f"Input '{directory}' is not a directory.")
 
-    iterator = directory.rglob("*") if recursive else directory.iterdir()
-    files = []
-    for path in iterator:
-        if not path.is_file():
-            continue
-        if allowed_extensions is None:
-            files.append(path)
-        elif path.suffix.lower() in allowed_extensions:
-            files.append(path)
-
+    files = list(
+        _scan_image_files(
+            str(directory),
+            recursive=recursive,
+            allowed_suffixes=tuple(allowed_extensions) if allowed_extensions else None,
+        )
+    )
+    # Sorting the plain strings avoids Path.__lt__ overhead; Path objects are
+    # built only for the accepted entries.
     files.sort()
 
     return [
-        InputRecord(index=i + 1, path=path)
+        InputRecord(index=i + 1, path=Path(path))
         for i, path in enumerate(files)
     ]
 
@@ -245,14 +303,25 @@ def load_records_from_path(
     )
 
 
-@lru_cache(maxsize=1024)
-@with_timeout(5.0)  # 5 second timeout for reverse geocoding
-def _reverse_lookup_cached(lat_rounded: float, lon_rounded: float) -> Dict[str, str]:
-    """Cached reverse geocoding to avoid duplicate lookups.
+# Decimal places used when quantizing coordinates into cache keys. 3 places
+# is ~111m — well below the neighbourhood scale at which reverse-geocode
+# results actually change, and roughly 10x the hit rate of the previous
+# 4-place (~11m) keys. Override via GEO_CACHE_PRECISION if finer keys are
+# ever needed.
+_GEO_CACHE_PRECISION = int(os.environ.get("GEO_CACHE_PRECISION", "3"))
 
-    Coordinates are rounded to 4 decimal places (~11m precision) for better cache hits.
-    Includes timeout protection to prevent hanging on slow lookups.
-    """
+# Shared cache for both the per-point and batched lookup paths; coordinates
+# are quantized (see _GEO_CACHE_PRECISION) so nearby predictions across
+# images of the same region share entries. A plain dict beats lru_cache here: hits are
+# a bare (GIL-atomic) dict get with no wrapper lock or linked-list
+# bookkeeping, and eviction only runs on the miss path.
+_REVERSE_CACHE: Dict[Tuple[float, float], Dict[str, str]] = {}
+_REVERSE_CACHE_MAX = 4096
+
+
+@with_timeout(5.0)  # 5 second timeout for reverse geocoding
+def _reverse_lookup_uncached(lat_rounded: float, lon_rounded: float) -> Dict[str, str]:
+    """Reverse geocode one rounded coordinate, with timeout protection."""
     try:
         return reverse_geocode.get((lat_rounded, lon_rounded))
     except Exception:
@@ -261,35 +330,119 @@ def _reverse_lookup_cached(lat_rounded: float, lon_rounded: float) -> Dict[str,
 
 def reverse_lookup(latitude: float, longitude: float) -> Dict[str, str]:
     """Fetch human-readable location details for the given coordinates."""
-    # Round to 4 decimal places (~11m precision) for better cache hits
-    lat_rounded = round(latitude, 4)
-    lon_rounded = round(longitude, 4)
-    result = _reverse_lookup_cached(lat_rounded, lon_rounded)
-    return result if result is not None else {}
+    key = (
+        round(latitude, _GEO_CACHE_PRECISION),
+        round(longitude, _GEO_CACHE_PRECISION),
+    )
+    cached = _REVERSE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _reverse_lookup_uncached(*key) or {}
+    _REVERSE_CACHE[key] = result
+    while len(_REVERSE_CACHE) > _REVERSE_CACHE_MAX:
+        # pop with a default: concurrent threads can race to evict the same
+        # oldest key, and the loser must not raise.
+        _REVERSE_CACHE.pop(next(iter(_REVERSE_CACHE)), None)
+    return result
+
+
+@with_timeout(5.0)
+def _reverse_search(coordinates: List[Tuple[float, float]]) -> List[Dict[str, str]]:
+    try:
+        return reverse_geocode.search(coordinates)
+    except Exception:
+        return [{} for _ in coordinates]
+
+
+def reverse_lookup_many(
+    coordinates: Sequence[Tuple[float, float]],
+) -> List[Dict[str, str]]:
+    """Reverse geocode many coordinates with a single KD-tree query.
+
+    Per-point lookups pay Python dispatch and tree-query overhead for every
+    (image x top_k) candidate; batching collapses that into one
+    ``reverse_geocode.search`` call for the cache misses.
+    """
+    rounded = [
+        (round(lat, _GEO_CACHE_PRECISION), round(lon, _GEO_CACHE_PRECISION))
+        for lat, lon in coordinates
+    ]
+    misses = [key for key in dict.fromkeys(rounded) if key not in _REVERSE_CACHE]
+    if misses:
+        found = _reverse_search(misses)
+        if found is None:
+            found = [{} for _ in misses]
+        for key, value in zip(misses, found):
+            _REVERSE_CACHE[key] = value or {}
+        while len(_REVERSE_CACHE) > _REVERSE_CACHE_MAX:
+            _REVERSE_CACHE.pop(next(iter(_REVERSE_CACHE)), None)
+    return [_REVERSE_CACHE.get(key, {}) for key in rounded]
+
+
+class _RecordDataset(torch.utils.data.Dataset):
+    """Decode and preprocess record images inside DataLoader workers.
+
+    Only the lightweight Hugging Face image processor travels to the worker
+    processes, not the model weights. Unreadable files surface as an error
+    string in the item instead of raising, so one bad image cannot kill a
+    worker.
+    """
+
+    def __init__(self, records: Sequence[InputRecord], processor) -> None:
+        self._records = records
+        self._processor = processor
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, idx: int):
+        record = self._records[idx]
+        try:
+            with Image.open(record.path) as img:
+                tensor = self._processor(
+                    images=img.convert("RGB"), return_tensors="pt"
+                )["pixel_values"]
+            return idx, tensor, None
+        except Exception as exc:
+            return idx, None, f"Prediction failed: {exc}"
+
+
+def _collate_record_items(items: List) -> List:
+    """Identity collate; items are stacked later on the compute device."""
+    return items
+
+
+def _iter_chunks(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of at most ``size`` items from ``iterable``."""
+    chunk: List[T] = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 def _materialize_predictions(
     gps: Union[Sequence, "torch.Tensor"],  # type: ignore[name-defined]
     probs: Union[Sequence, "torch.Tensor"],  # type: ignore[name-defined]
-) -> Tuple[List[Sequence[float]], List[float]]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Convert GeoCLIP outputs into plain Python lists regardless of tensor types.
+    Convert GeoCLIP outputs into numpy arrays regardless of tensor types.
 
-    GeoCLIP may return PyTorch tensors; attempting truthiness on them raises an
-    error. Converting early keeps the rest of the pipeline framework-agnostic.
+    Tensors are moved host-side with one ``.cpu().numpy()`` transfer each
+    rather than ``tolist()``, which forced a blocking sync plus per-element
+    Python float boxing. Downstream code only needs iteration and float
+    casts, both of which numpy rows provide.
     """
 
-    def _to_list(value: Union[Sequence, "torch.Tensor"]) -> List:
-        if hasattr(value, "tolist"):
-            try:
-                return list(value.tolist())  # type: ignore[call-arg]
-            except TypeError:
-                pass
-        return list(value)
+    def _to_numpy(value: Union[Sequence, "torch.Tensor"]) -> np.ndarray:
+        if isinstance(value, torch.Tensor):
+            return value.detach().cpu().numpy()
+        return np.asarray(value)
 
-    gps_list = _to_list(gps)
-    probs_list = _to_list(probs)
-    return gps_list, probs_list
+    return _to_numpy(gps), _to_numpy(probs)
 
 
 def _gpu_backend() -> Optional[str]:
@@ -327,16 +480,125 @@ def select_device(requested: str) -> Tuple[str, str]:
     raise RuntimeError(f"Unknown device option '{requested}'.")
 
 
+# One GeoCLIP instance per compute device, loaded lazily and reused by every
+# predictor on that device. Predictors mutate their module in place (device
+# moves, channels_last conversion, torch.compile rebinding), so a single
+# instance shared across devices would be silently moved and rewrapped out
+# from under another predictor's in-flight requests whenever a second device
+# variant was constructed.
+_shared_model_lock = threading.Lock()
+_shared_models: Dict[str, GeoCLIP] = {}
+
+
+def _load_shared_model(device: str) -> GeoCLIP:
+    """Return the per-process GeoCLIP module for ``device``, loading on first use."""
+    with _shared_model_lock:
+        model = _shared_models.get(device)
+        if model is None:
+            model = GeoCLIP()
+            model.to(device)
+            _shared_models[device] = model
+        return model
+
+
+# The gallery embedding is a deterministic function of the static gallery
+# coordinates and the frozen location-encoder weights, so it is shared across
+# predictor instances and persisted to disk for warm starts.
+_gallery_features_lock = threading.Lock()
+_gallery_features_cache: Dict[str, torch.Tensor] = {}
+_GALLERY_FEATURES_FILE = Path.home() / ".cache" / "llocale" / "gallery_features.pt"
+_ONNX_ENCODER_FILE = Path.home() / ".cache" / "llocale" / "image_encoder.onnx"
+
+
+def _load_gallery_features(model: GeoCLIP, device: str) -> torch.Tensor:
+    """Return the normalized gallery embeddings for ``device``.
+
+    Checks the in-process cache first, then the on-disk copy, and only
+    encodes the gallery when neither is available; freshly computed features
+    are written back to disk so subsequent processes skip the encode.
+    """
+    with _gallery_features_lock:
+        cached = _gallery_features_cache.get(device)
+        if cached is not None:
+            return cached
+
+        features: Optional[torch.Tensor] = None
+        if _GALLERY_FEATURES_FILE.exists():
+            try:
+                features = torch.load(
+                    _GALLERY_FEATURES_FILE, map_location=device
+                )
+                if features.shape[0] != model.gps_gallery.shape[0]:
+                    features = None  # stale cache from another gallery
+            except Exception as exc:
+                logger.debug(f"Ignoring unreadable gallery feature cache: {exc}")
+                features = None
+
+        if features is None:
+            with torch.inference_mode():
+                features = torch.nn.functional.normalize(
+                    model.location_encoder(model.gps_gallery.to(device)), dim=1
+                )
+            try:
+                _GALLERY_FEATURES_FILE.parent.mkdir(parents=True, exist_ok=True)
+                torch.save(features.cpu(), _GALLERY_FEATURES_FILE)
+            except Exception as exc:
+                logger.debug(f"Could not persist gallery feature cache: {exc}")
+
+        _gallery_features_cache[device] = features
+        return features
+
+
 class GeoClipPredictor:
     """Thin wrapper around the GeoCLIP model providing batch prediction utilities."""
 
-    def __init__(self, *, device: str = "auto") -> None:
+    def __init__(self, *, device: str = "auto", engine: str = "torch") -> None:
         self._requested_device = device
         compute_device, display_device = select_device(device)
         self._device = compute_device
         self._device_label = display_device
-        self._model = GeoCLIP()
-        self._model.to(self._device)
+        self._model = _load_shared_model(self._device)
+        # Dedicated stream for host-to-device copies so the upload of the next
+        # batch can overlap with compute still running on the default stream.
+        self._copy_stream: Optional["torch.cuda.Stream"] = (
+            torch.cuda.Stream() if self._device == "cuda" else None
+        )
+        # Compute streams for splitting large batches (see _forward).
+        self._streams: List["torch.cuda.Stream"] = (
+            [torch.cuda.Stream() for _ in range(NUM_CUDA_STREAMS)]
+            if self._device == "cuda"
+            else []
+        )
+        # GeoCLIP.predict re-transfers the GPS gallery and re-encodes it with
+        # the location encoder on every call, even though both are static.
+        # Encode the gallery once here; per batch only the image embeddings
+        # and one matmul against these features remain. On CUDA the features
+        # are kept in fp16, halving bandwidth into the gallery matmul;
+        # coordinates are gathered from the fp32 gallery on the CPU model,
+        # so output precision is unaffected.
+        features = _load_gallery_features(self._model, self._device)
+        self._gallery_features = (
+            features.half() if self._device == "cuda" else features
+        )
+        # Optional ONNX Runtime engine for the image encoder; the tiny
+        # location-encoder/gallery side stays in torch. Falls back to torch
+        # when onnxruntime is missing or the export fails.
+        self._onnx_session = (
+            self._init_onnx_session() if engine == "onnx" else None
+        )
+        if self._device == "cuda" and self._onnx_session is None:
+            # channels_last improves tensor-core tiling for the conv-heavy
+            # image encoder; torch.compile fuses kernels after warmup. A
+            # failed compile (e.g. no triton in the build) just stays eager.
+            self._model.image_encoder = self._model.image_encoder.to(
+                memory_format=torch.channels_last
+            )
+            try:
+                self._model.image_encoder = torch.compile(
+                    self._model.image_encoder, mode="reduce-overhead", fullgraph=False
+                )
+            except Exception as exc:
+                logger.debug(f"torch.compile unavailable, staying eager: {exc}")
 
     @property
     def device(self) -> str:
@@ -346,72 +608,404 @@ class GeoClipPredictor:
     def device_label(self) -> str:
         return self._device_label
 
+    def warmup(self) -> None:
+        """Run one dummy forward pass so compile/JIT cost is paid up front.
+
+        torch.compile traces on first call; without a warmup the first real
+        request absorbs that latency. Errors are swallowed — warmup is purely
+        an optimization.
+        """
+        try:
+            dummy = torch.zeros(1, 3, 224, 224)
+            self._forward(self._upload_batch(dummy))
+        except Exception as exc:
+            logger.debug(f"Warmup forward failed (ignored): {exc}")
+
     def predict_records(
         self,
         records: Iterable[InputRecord],
         *,
         top_k: int,
         skip_missing: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        num_workers: Optional[int] = None,
     ) -> Iterator[PredictionOutcome]:
-        for record in records:
-            if not record.path.exists():
-                message = f"File does not exist: {record.path}"
+        """Run predictions over ``records``, batching images per forward pass.
+
+        Records are grouped into mini-batches of ``batch_size`` so the model
+        runs one forward pass (and one gallery matmul) for the whole group
+        instead of per image. On multi-batch runs, JPEG decode and the image
+        transform move into DataLoader worker processes so preprocessing of
+        the next batch overlaps with inference on the current one.
+        ``num_workers`` defaults to half the CPU count; pass 0 to force
+        in-process decoding. Outcomes are yielded in the original record
+        order; missing files short-circuit without touching the model.
+        """
+        if batch_size < 1:
+            batch_size = 1
+        if num_workers is None:
+            num_workers = (os.cpu_count() or 2) // 2
+
+        record_list = records if isinstance(records, list) else list(records)
+        processor = getattr(self._model.image_encoder, "image_processor", None)
+        if (
+            num_workers > 0
+            and processor is not None
+            and len(record_list) > batch_size
+        ):
+            yield from self._predict_records_with_loader(
+                record_list,
+                top_k=top_k,
+                skip_missing=skip_missing,
+                batch_size=batch_size,
+                num_workers=num_workers,
+                processor=processor,
+            )
+            return
+
+        for chunk in _iter_chunks(record_list, batch_size):
+            present: List[InputRecord] = []
+            placeholders: Dict[int, PredictionOutcome] = {}
+
+            for position, record in enumerate(chunk):
+                if record.path.exists():
+                    present.append(record)
+                    continue
+                message = f"File does not exist: {record.path_str}"
                 if skip_missing:
-                    yield PredictionOutcome(
+                    placeholders[position] = PredictionOutcome(
                         record=record,
                         warnings=[message],
                         predictions=[],
                     )
-                    continue
-                yield PredictionOutcome(
-                    record=record,
-                    error=message,
-                    predictions=[],
+                else:
+                    placeholders[position] = PredictionOutcome(
+                        record=record,
+                        error=message,
+                        predictions=[],
+                    )
+
+            outcomes = self._predict_batch(present, top_k=top_k)
+
+            results = iter(outcomes)
+            for position, record in enumerate(chunk):
+                if position in placeholders:
+                    yield placeholders[position]
+                else:
+                    yield next(results)
+
+    def _predict_records_with_loader(
+        self,
+        record_list: List[InputRecord],
+        *,
+        top_k: int,
+        skip_missing: bool,
+        batch_size: int,
+        num_workers: int,
+        processor,
+    ) -> Iterator[PredictionOutcome]:
+        """Multi-batch path: decode/preprocess in DataLoader workers.
+
+        Present records stream through a DataLoader that prefetches and pins
+        batches while the GPU is busy; missing files are interleaved back at
+        their original positions without touching the loader.
+        """
+        present_flags = [record.path.exists() for record in record_list]
+        present = [
+            record for record, flag in zip(record_list, present_flags) if flag
+        ]
+
+        loader = torch.utils.data.DataLoader(
+            _RecordDataset(present, processor),
+            batch_size=batch_size,
+            num_workers=num_workers,
+            pin_memory=self._device == "cuda",
+            prefetch_factor=2,
+            collate_fn=_collate_record_items,
+        )
+
+        def batch_outcomes() -> Iterator[PredictionOutcome]:
+            for items in loader:
+                chunk_records = [present[idx] for idx, _, _ in items]
+                tensors = [tensor for _, tensor, _ in items if tensor is not None]
+                loadable = [
+                    position
+                    for position, (_, tensor, _) in enumerate(items)
+                    if tensor is not None
+                ]
+                failures = {
+                    position: error
+                    for position, (_, _, error) in enumerate(items)
+                    if error is not None
+                }
+                yield from self._predict_preprocessed(
+                    chunk_records, tensors, loadable, failures, top_k=top_k
                 )
+
+        results = batch_outcomes()
+        for record, flag in zip(record_list, present_flags):
+            if flag:
+                yield next(results)
                 continue
+            message = f"File does not exist: {record.path_str}"
+            if skip_missing:
+                yield PredictionOutcome(
+                    record=record, warnings=[message], predictions=[]
+                )
+            else:
+                yield PredictionOutcome(
+                    record=record, error=message, predictions=[]
+                )
 
-            try:
-                gps_predictions, probabilities = self._model.predict(
-                    str(record.path), top_k=top_k
+    def _upload_batch(self, batch: torch.Tensor) -> torch.Tensor:
+        """Move a stacked input batch onto the compute device.
+
+        On CUDA the tensor is staged in pinned host memory and copied
+        asynchronously on a dedicated copy stream, so the transfer overlaps
+        with any inference still in flight on the default stream. On CPU this
+        is a plain (no-op) ``.to``.
+        """
+        if self._copy_stream is None:
+            return batch.to(self._device)
+
+        pinned = batch.pin_memory()
+        copy_done = torch.cuda.Event()
+        with torch.cuda.stream(self._copy_stream):
+            device_batch = pinned.to(self._device, non_blocking=True)
+            copy_done.record(self._copy_stream)
+        torch.cuda.current_stream().wait_event(copy_done)
+        return device_batch.contiguous(memory_format=torch.channels_last)
+
+    def _init_onnx_session(self):
+        """Export the image encoder to ONNX once and open an ORT session.
+
+        Returns None (torch engine keeps running) when onnxruntime is not
+        installed or the export/session setup fails.
+        """
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.warning(
+                "onnxruntime is not installed; falling back to the torch engine."
+            )
+            return None
+
+        try:
+            if not _ONNX_ENCODER_FILE.exists():
+                _ONNX_ENCODER_FILE.parent.mkdir(parents=True, exist_ok=True)
+                dummy = torch.zeros(1, 3, 224, 224, device=self._device)
+                torch.onnx.export(
+                    self._model.image_encoder,
+                    dummy,
+                    str(_ONNX_ENCODER_FILE),
+                    opset_version=17,
+                    input_names=["input"],
+                    output_names=["features"],
+                    dynamic_axes={"input": {0: "batch"}, "features": {0: "batch"}},
                 )
-                gps_predictions, probabilities = _materialize_predictions(
-                    gps_predictions, probabilities
+            providers = ["CPUExecutionProvider"]
+            if self._device == "cuda":
+                providers.insert(
+                    0,
+                    (
+                        "CUDAExecutionProvider",
+                        {"cudnn_conv_algo_search": "EXHAUSTIVE"},
+                    ),
                 )
-            except Exception as exc:  # pragma: no cover - propagate details to caller
-                yield PredictionOutcome(
-                    record=record,
-                    error=f"Prediction failed: {exc}",
+            return ort.InferenceSession(str(_ONNX_ENCODER_FILE), providers=providers)
+        except Exception as exc:
+            logger.warning(
+                f"ONNX engine unavailable ({exc}); falling back to the torch engine."
+            )
+            return None
+
+    def _encode_images(self, chunk: torch.Tensor) -> torch.Tensor:
+        if self._onnx_session is not None:
+            outputs = self._onnx_session.run(
+                None,
+                {"input": chunk.contiguous().cpu().numpy().astype(np.float32)},
+            )
+            return torch.from_numpy(outputs[0]).to(self._device)
+        return self._model.image_encoder(chunk)
+
+    def _score_chunk(self, chunk: torch.Tensor) -> torch.Tensor:
+        """Logits for one chunk: encode images, matmul against gallery features."""
+        features = torch.nn.functional.normalize(self._encode_images(chunk), dim=1)
+        return self._model.logit_scale.exp() * (
+            features @ self._gallery_features.t()
+        )
+
+    def _forward(self, batch: torch.Tensor) -> torch.Tensor:
+        """Score a batch against the precomputed gallery embeddings.
+
+        Only the image encoder runs per batch; the gallery side of GeoCLIP's
+        forward was folded into ``self._gallery_features`` at construction.
+        ``inference_mode`` skips version-counter bookkeeping entirely; on CUDA
+        the pass additionally runs under fp16 autocast to use tensor cores for
+        the encoder and gallery matmul.
+        """
+        with torch.inference_mode():
+            if self._device != "cuda":
+                return self._score_chunk(batch)
+            with torch.autocast(device_type="cuda", dtype=torch.float16):
+                if batch.shape[0] < 2 * len(self._streams):
+                    return self._score_chunk(batch)
+                # Large batches are split across streams so per-chunk launch
+                # and transfer overhead overlaps with compute on the others;
+                # torch.chunk spreads the remainder over the first chunks.
+                chunks = torch.chunk(batch, len(self._streams), dim=0)
+                outputs: List[torch.Tensor] = []
+                for stream, chunk in zip(self._streams, chunks):
+                    stream.wait_stream(torch.cuda.current_stream())
+                    with torch.cuda.stream(stream):
+                        outputs.append(self._score_chunk(chunk))
+                for stream in self._streams[: len(chunks)]:
+                    torch.cuda.current_stream().wait_stream(stream)
+                return torch.cat(outputs, dim=0)
+
+    def _predict_batch(
+        self,
+        records: Sequence[InputRecord],
+        *,
+        top_k: int,
+    ) -> List[PredictionOutcome]:
+        """Predict a mini-batch of existing records with one forward pass.
+
+        Falls back to the single-image ``GeoCLIP.predict`` path when the
+        batched path fails, so odd inputs degrade to the old behaviour
+        instead of failing the whole group.
+        """
+        if not records:
+            return []
+
+        tensors: List[torch.Tensor] = []
+        loadable: List[int] = []
+        failures: Dict[int, str] = {}
+        for position, record in enumerate(records):
+            try:
+                with Image.open(record.path) as img:
+                    tensors.append(
+                        self._model.image_encoder.preprocess_image(img.convert("RGB"))
+                    )
+                loadable.append(position)
+            except Exception as exc:
+                failures[position] = f"Prediction failed: {exc}"
+
+        return self._predict_preprocessed(
+            records, tensors, loadable, failures, top_k=top_k
+        )
+
+    def _predict_preprocessed(
+        self,
+        records: Sequence[InputRecord],
+        tensors: List[torch.Tensor],
+        loadable: List[int],
+        failures: Dict[int, str],
+        *,
+        top_k: int,
+    ) -> List[PredictionOutcome]:
+        """Run the forward pass and build outcomes for decoded tensors.
+
+        ``tensors`` holds one preprocessed ``(1,3,H,W)`` tensor per entry in
+        ``loadable`` (positions into ``records``); ``failures`` maps positions
+        whose decode failed to their error message.
+        """
+        batched: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        if loadable:
+            try:
+                batch = self._upload_batch(torch.cat(tensors, dim=0))
+                logits = self._forward(batch)
+                # Softmax over the full gallery row, then gather the top-k
+                # values. Normalizing over only the selected k would rescale
+                # probabilities to ~1/k and disagree with the per-image
+                # fallback below (full-gallery softmax); next to the
+                # (B x gallery) matmul the full softmax is negligible.
+                k = min(top_k, logits.shape[-1])
+                probs = logits.float().softmax(dim=-1)
+                top_probs, top_indices = torch.topk(probs, k, dim=1)
+                # One D2H transfer for the whole batch; per-row slices below
+                # are views into these arrays.
+                indices = top_indices.cpu()
+                coords_np = self._model.gps_gallery[indices].numpy()
+                values_np = top_probs.cpu().numpy()
+                for row, position in enumerate(loadable):
+                    batched[position] = (coords_np[row], values_np[row])
+            except Exception as exc:
+                logger.debug(f"Batched prediction failed, falling back per image: {exc}")
+                batched = {}
+
+        outcomes: List[Optional[PredictionOutcome]] = []
+        pending: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        batch_coords: List[Tuple[float, float]] = []
+        for position, record in enumerate(records):
+            if position in failures:
+                outcomes.append(
+                    PredictionOutcome(record=record, error=failures[position])
                 )
                 continue
 
-            if not gps_predictions:
-                yield PredictionOutcome(
-                    record=record,
-                    error="Model returned no predictions.",
+            if position in batched:
+                gps_predictions, probabilities = batched[position]
+            else:
+                try:
+                    gps_predictions, probabilities = self._model.predict(
+                        record.path_str, top_k=top_k
+                    )
+                    gps_predictions, probabilities = _materialize_predictions(
+                        gps_predictions, probabilities
+                    )
+                except Exception as exc:  # pragma: no cover - propagate details to caller
+                    outcomes.append(
+                        PredictionOutcome(
+                            record=record,
+                            error=f"Prediction failed: {exc}",
+                        )
+                    )
+                    continue
+
+            if not len(gps_predictions):
+                outcomes.append(
+                    PredictionOutcome(
+                        record=record,
+                        error="Model returned no predictions.",
+                    )
                 )
                 continue
 
+            outcomes.append(None)
+            pending.append((position, gps_predictions, probabilities))
+            batch_coords.extend(
+                (float(coords[0]), float(coords[1])) for coords in gps_predictions
+            )
+
+        # One batched KD-tree query covers every candidate in the mini-batch.
+        locations = reverse_lookup_many(batch_coords)
+        cursor = 0
+        for position, gps_predictions, probabilities in pending:
             candidates: List[LocationPrediction] = []
             for rank, (coords, prob) in enumerate(
                 zip(gps_predictions, probabilities), start=1
             ):
                 lat, lon = map(float, coords)
-                probability = float(prob)
-                location = reverse_lookup(lat, lon)
+                location = locations[cursor]
+                cursor += 1
                 candidates.append(
                     LocationPrediction(
                         rank=rank,
                         latitude=lat,
                         longitude=lon,
-                        probability=probability,
+                        probability=float(prob),
                         city=location.get("city", "") or "",
                         state=location.get("state", "") or "",
                         county=location.get("county", "") or "",
                         country=location.get("country", "") or "",
                     )
                 )
+            outcomes[position] = PredictionOutcome(
+                record=records[position], predictions=candidates
+            )
 
-            yield PredictionOutcome(record=record, predictions=candidates)
+        return outcomes
 
 
 def ensure_output_directory(path: Path) -> None:
@@ -420,16 +1014,25 @@ def ensure_output_directory(path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Last cache root applied, so repeated calls (e.g. per API request) skip the
+# mkdir syscalls and env writes once the environment is already set up.
+_applied_cache_root: Optional[Path] = None
+
+
 def set_hf_cache_environment(cache_root: Optional[Path]) -> None:
-    """Apply Hugging Face cache environment overrides."""
+    """Apply Hugging Face cache environment overrides (idempotent)."""
+    global _applied_cache_root
     if cache_root is None:
         return
+    if cache_root == _applied_cache_root and os.environ.get("HF_HOME") == str(cache_root):
+        return
     cache_root.mkdir(parents=True, exist_ok=True)
     for subdir in ("hub", "transformers"):
         (cache_root / subdir).mkdir(parents=True, exist_ok=True)
     os.environ["HF_HOME"] = str(cache_root)
     os.environ["HUGGINGFACE_HUB_CACHE"] = str(cache_root / "hub")
     os.environ["TRANSFORMERS_CACHE"] = str(cache_root / "transformers")
+    _applied_cache_root = cache_root
 
 
 def _setup_cache(cache_path: Optional[Path]) -> Path:
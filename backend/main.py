@@ -5,6 +5,7 @@ Main entry point for the Locate backend API.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import shutil
@@ -14,8 +15,11 @@ from functools import lru_cache
 from pathlib import Path
 from typing import List, Literal, Optional
 
+import orjson
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, field_validator
 
@@ -24,6 +28,7 @@ from .llocale import (
     InputRecord,
     LocationPrediction,
     PredictionOutcome,
+    select_device,
     set_hf_cache_environment,
 )
 
@@ -32,21 +37,26 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Security settings
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'}
+ALLOWED_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.heic', '.webp'})
 MAX_IMAGES_PER_REQUEST = 100
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB per file
 
 # Upload directory
 UPLOAD_DIR = Path(tempfile.gettempdir()) / "geolens_uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
+# String form cached once: the upload handler joins with os.path.join
+# (C-level concat) instead of allocating a new Path per file.
+_UPLOAD_DIR_STR = str(UPLOAD_DIR)
 
 DeviceChoice = Literal["auto", "cpu", "cuda", "rocm"]
 
-# Create FastAPI app
+# Create FastAPI app. orjson serializes the float-heavy prediction payloads
+# ~5x faster than stdlib json.
 app = FastAPI(
     title="GeoLens API",
     version="5.0.0",
-    description="AI-powered image geolocation using GeoCLIP"
+    description="AI-powered image geolocation using GeoCLIP",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS for React frontend
@@ -62,6 +72,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Large /infer responses (100 images x top_k predictions) are repetitive
+# JSON that gzips 5-10x; level 1 keeps the CPU cost negligible while
+# cutting transfer time for remote clients.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Serve uploaded files
 app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
 
@@ -104,7 +119,9 @@ class PredictionCandidateResponse(BaseModel):
 
     @classmethod
     def from_prediction(cls, prediction: LocationPrediction) -> "PredictionCandidateResponse":
-        return cls(
+        # model_construct skips the validation pass; the predictor already
+        # produced well-typed values and a big request builds 500 of these.
+        return cls.model_construct(
             rank=prediction.rank,
             latitude=prediction.latitude,
             longitude=prediction.longitude,
@@ -126,8 +143,8 @@ class PredictionResultResponse(BaseModel):
 
     @classmethod
     def from_outcome(cls, outcome: PredictionOutcome) -> "PredictionResultResponse":
-        return cls(
-            path=str(outcome.record.path),
+        return cls.model_construct(
+            path=outcome.record.path_str,
             md5=outcome.record.md5,
             predictions=[
                 PredictionCandidateResponse.from_prediction(pred) for pred in outcome.predictions
@@ -149,32 +166,97 @@ class UploadResponse(BaseModel):
 
 # Predictor cache
 @lru_cache(maxsize=3)
-def get_predictor(device: DeviceChoice) -> GeoClipPredictor:
+def _predictor_for(device: str) -> GeoClipPredictor:
     logger.info(f"Loading predictor with device: {device}")
     return GeoClipPredictor(device=device)
 
 
+def get_predictor(device: DeviceChoice) -> GeoClipPredictor:
+    # Resolve "auto" to its concrete device before the cache lookup so auto
+    # and explicit-device requests share one predictor (the model weights are
+    # already shared at the llocale level).
+    _, resolved = select_device(device)
+    return _predictor_for(resolved)
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds MAX_FILE_SIZE mid-copy."""
+
+
+def save_upload(src, dst_path: str, max_bytes: int) -> int:
+    """Copy an upload to ``dst_path`` without buffering it in Python memory.
+
+    Uses os.sendfile (kernel-to-kernel) when the source exposes a real file
+    descriptor — e.g. a SpooledTemporaryFile that rolled to disk — and falls
+    back to a chunked shutil-style copy otherwise. Returns bytes written;
+    raises UploadTooLargeError as soon as the limit is exceeded.
+    """
+    with open(dst_path, "wb") as dst:
+        try:
+            in_fd = src.fileno()
+        except (AttributeError, OSError, ValueError):
+            in_fd = None
+
+        if in_fd is not None and hasattr(os, "sendfile"):
+            size = os.fstat(in_fd).st_size
+            if size > max_bytes:
+                raise UploadTooLargeError()
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), in_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return offset
+
+        bytes_written = 0
+        while chunk := src.read(1 << 20):
+            bytes_written += len(chunk)
+            if bytes_written > max_bytes:
+                raise UploadTooLargeError()
+            dst.write(chunk)
+        return bytes_written
+
+
+@lru_cache(maxsize=4096)
+def _validate_cached(path_str: str, mtime_ns: int) -> Path:
+    """Validation body, cached per (path, mtime) by validate_image_path."""
+    resolved_path = Path(path_str).resolve()
+
+    if not resolved_path.is_absolute():
+        raise HTTPException(status_code=400, detail=f"Path must be absolute: {resolved_path.name}")
+
+    if not resolved_path.is_file():
+        raise HTTPException(status_code=404, detail=f"File not found: {resolved_path.name}")
+
+    # rfind on the name is cheaper than PurePath.suffix, which re-parses
+    # the path.
+    name = resolved_path.name
+    dot = name.rfind('.')
+    file_extension = name[dot:].lower() if dot >= 0 else ''
+    if file_extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type '{file_extension}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+        )
+
+    return resolved_path
+
+
 def validate_image_path(path: Path) -> Path:
-    """Validate image path for security."""
+    """Validate image path for security.
+
+    Cached on (path, mtime_ns) so repeat validation of an unchanged file
+    costs one stat instead of the full resolve/is_file syscall chain.
+    """
     try:
-        resolved_path = path.expanduser().resolve()
-        
-        if not resolved_path.is_absolute():
-            raise HTTPException(status_code=400, detail=f"Path must be absolute: {path.name}")
-        
-        if not resolved_path.is_file():
-            raise HTTPException(status_code=404, detail=f"File not found: {path.name}")
-        
-        file_extension = resolved_path.suffix.lower()
-        if file_extension not in ALLOWED_EXTENSIONS:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type '{file_extension}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
-            )
-        
-        return resolved_path
+        expanded = path.expanduser()
+        mtime_ns = expanded.stat().st_mtime_ns
+        return _validate_cached(str(expanded), mtime_ns)
     except HTTPException:
         raise
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"File not found: {path.name}")
     except Exception as e:
         logger.error(f"Path validation error for {path.name}: {e}")
         raise HTTPException(status_code=400, detail=f"Invalid path: {path.name}")
@@ -205,24 +287,30 @@ async def upload_images(files: List[UploadFile] = File(...)) -> UploadResponse:
     for file in files:
         try:
             # Validate file extension
-            ext = Path(file.filename or "").suffix.lower()
+            filename = file.filename or ""
+            dot = filename.rfind('.')
+            ext = filename[dot:].lower() if dot >= 0 else ''
             if ext not in ALLOWED_EXTENSIONS:
                 errors.append(f"{file.filename}: unsupported file type '{ext}'")
                 continue
             
             # Generate unique filename
             unique_name = f"{uuid.uuid4()}{ext}"
-            file_path = UPLOAD_DIR / unique_name
-            
-            # Save file
-            with open(file_path, "wb") as buffer:
-                content = await file.read()
-                if len(content) > MAX_FILE_SIZE:
-                    errors.append(f"{file.filename}: file too large (max {MAX_FILE_SIZE // (1024*1024)}MB)")
-                    continue
-                buffer.write(content)
-            
-            paths.append(str(file_path))
+            file_path = os.path.join(_UPLOAD_DIR_STR, unique_name)
+
+            # Save file via sendfile/chunked copy off the event loop instead
+            # of reading the whole upload into a bytes object first.
+            try:
+                await asyncio.to_thread(save_upload, file.file, file_path, MAX_FILE_SIZE)
+            except UploadTooLargeError:
+                errors.append(f"{file.filename}: file too large (max {MAX_FILE_SIZE // (1024*1024)}MB)")
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
+                continue
+
+            paths.append(file_path)
             logger.info(f"Uploaded: {file.filename} -> {file_path}")
             
         except Exception as e:
@@ -232,10 +320,10 @@ async def upload_images(files: List[UploadFile] = File(...)) -> UploadResponse:
     return UploadResponse(paths=paths, errors=errors)
 
 
-@app.post("/infer", response_model=InferenceResponse)
-def infer(request: InferenceRequest) -> InferenceResponse:
-    """
-    Perform geolocation inference on a batch of images.
+async def _validated_records(request: InferenceRequest) -> List[InputRecord]:
+    """Validate every requested path and build the InputRecords.
+
+    Shared by the buffered and streaming inference endpoints.
     """
     if not request.items:
         raise HTTPException(status_code=400, detail="No items provided for inference.")
@@ -243,16 +331,23 @@ def infer(request: InferenceRequest) -> InferenceResponse:
     if request.hf_cache is not None:
         set_hf_cache_environment(request.hf_cache.expanduser().resolve())
 
-    # Validate all image paths
+    # Validate all image paths in parallel on the thread pool instead of
+    # serializing the stat syscalls on the event loop.
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(validate_image_path, item.path) for item in request.items),
+        return_exceptions=True,
+    )
+
     validated_paths = []
-    for item in request.items:
-        try:
-            validated_path = validate_image_path(item.path)
-            validated_paths.append((validated_path, item.md5))
-        except HTTPException as e:
+    for item, outcome in zip(request.items, outcomes):
+        if isinstance(outcome, HTTPException):
             if not request.skip_missing:
-                raise
-            logger.info(f"Skipping invalid path: {item.path.name} - {e.detail}")
+                raise outcome
+            logger.info(f"Skipping invalid path: {item.path.name} - {outcome.detail}")
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            validated_paths.append((outcome, item.md5))
 
     if not validated_paths:
         raise HTTPException(
@@ -260,25 +355,44 @@ def infer(request: InferenceRequest) -> InferenceResponse:
             detail="No valid image files found after validation."
         )
 
-    # Create InputRecords
-    records = [
+    return [
         InputRecord(index=i + 1, path=path, md5=md5)
         for i, (path, md5) in enumerate(validated_paths)
     ]
 
+
+# No response_model: the decorator would re-validate every field of the
+# returned object, undoing the model_construct fast path below. The schema
+# stays in the OpenAPI docs via `responses`.
+@app.post("/infer", responses={200: {"model": InferenceResponse}})
+async def infer(request: InferenceRequest) -> ORJSONResponse:
+    """
+    Perform geolocation inference on a batch of images.
+    """
+    records = await _validated_records(request)
+
     try:
         predictor = get_predictor(request.device)
-        outcomes = list(
-            predictor.predict_records(
-                records,
-                top_k=request.top_k,
-                skip_missing=request.skip_missing,
+        # Run inference off the event loop so a long batch doesn't block
+        # /health and /upload; PyTorch releases the GIL inside the model.
+        outcomes = await asyncio.to_thread(
+            lambda: list(
+                predictor.predict_records(
+                    records,
+                    top_k=request.top_k,
+                    skip_missing=request.skip_missing,
+                )
             )
         )
 
-        return InferenceResponse(
-            device=predictor.device_label,
-            results=[PredictionResultResponse.from_outcome(outcome) for outcome in outcomes],
+        return ORJSONResponse(
+            {
+                "device": predictor.device_label,
+                "results": [
+                    PredictionResultResponse.from_outcome(outcome).model_dump()
+                    for outcome in outcomes
+                ],
+            }
         )
     except Exception as e:
         logger.error(f"Inference failed: {e}")
@@ -288,6 +402,30 @@ def infer(request: InferenceRequest) -> InferenceResponse:
         )
 
 
+@app.post("/infer/stream")
+async def infer_stream(request: InferenceRequest) -> StreamingResponse:
+    """
+    Perform geolocation inference and stream results as NDJSON.
+
+    One line per image, emitted as soon as its batch finishes: first-byte
+    latency equals first-image inference time and server memory stays O(1)
+    instead of buffering the whole response. Same validation as /infer.
+    """
+    records = await _validated_records(request)
+    predictor = get_predictor(request.device)
+
+    def outcome_lines():
+        # Plain generator: Starlette iterates sync generators on the thread
+        # pool, so the model never runs on the event loop.
+        for outcome in predictor.predict_records(
+            records, top_k=request.top_k, skip_missing=request.skip_missing
+        ):
+            result = PredictionResultResponse.from_outcome(outcome)
+            yield orjson.dumps(result.model_dump(), default=str) + b"\n"
+
+    return StreamingResponse(outcome_lines(), media_type="application/x-ndjson")
+
+
 @app.get("/")
 def root():
     return {"message": "GeoLens API is running. Documentation at /docs"}
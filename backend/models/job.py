@@ -4,12 +4,12 @@ Job model for Locate queue system.
 Stores geolocation job state and results for shared workspace.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from enum import Enum
 import uuid
 
-from sqlalchemy import String, Text, DateTime, JSON
+from sqlalchemy import String, Text, DateTime, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -28,7 +28,23 @@ class Job(Base):
     """Geolocation job model."""
     
     __tablename__ = "locate_jobs"
-    
+
+    # list_jobs orders by created_at DESC (optionally filtered on status)
+    # and workers poll for pending jobs; without indexes every paginated
+    # list is a full scan + sort once the table grows.
+    __table_args__ = (
+        Index("ix_locate_jobs_created_at", "created_at"),
+        Index("ix_locate_jobs_status_created", "status", "created_at"),
+        Index(
+            "ix_locate_jobs_pending",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # create_job's duplicate-results lookup filters on exactly these
+        # columns; without the index every upload pays a sequential scan.
+        Index("ix_locate_jobs_dedup", "filename", "top_k", "status"),
+    )
+
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
     )
@@ -48,19 +64,25 @@ class Job(Base):
     # Settings
     top_k: Mapped[int] = mapped_column(default=5)
     
-    # Timestamps
+    # Timestamps (timezone-aware so asyncpg hands back tz-aware datetimes
+    # without Python-side conversion)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
     started_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, nullable=True
+        DateTime(timezone=True), nullable=True
     )
     completed_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, nullable=True
+        DateTime(timezone=True), nullable=True
     )
-    
+
     def to_dict(self) -> dict:
-        """Convert to dictionary for API responses."""
+        """Convert to dictionary for API responses.
+
+        Timestamps stay as datetime objects: the routes serialize through
+        ORJSONResponse, which emits ISO-8601 in C, so stringifying them here
+        with isoformat() per row would just be slower duplicate work.
+        """
         return {
             "id": str(self.id),
             "filename": self.original_filename,
@@ -68,7 +90,7 @@ class Job(Base):
             "error": self.error,
             "results": self.results,
             "top_k": self.top_k,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
         }
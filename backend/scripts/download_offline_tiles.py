@@ -12,6 +12,7 @@ import argparse
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from urllib.request import urlopen, Request
 from urllib.error import HTTPError, URLError
@@ -20,14 +21,29 @@ from urllib.error import HTTPError, URLError
 TILE_SERVER = "https://a.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}.png"
 USER_AGENT = "GeoLens/2.4 (Offline Tile Downloader)"
 
+# One shared client reuses TCP/TLS connections across every tile request
+# (CartoCDN speaks HTTP/2, so many in-flight requests multiplex onto a few
+# connections); plain urlopen pays DNS + TCP + TLS per tile. Falls back to
+# urllib when httpx isn't installed.
+try:
+    import httpx
+    _CLIENT = httpx.Client(
+        http2=True, headers={"User-Agent": USER_AGENT}, timeout=10
+    )
+except ImportError:
+    _CLIENT = None
+
 # Default configuration
 DEFAULT_MIN_ZOOM = 0
 DEFAULT_MAX_ZOOM = 8
+# Tile fetches are latency-bound network I/O (GIL released), so a wide pool
+# gives near-linear speedup until the CDN rate-limits.
+MAX_WORKERS = 32
 DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "Assets" / "Maps" / "tiles"
 
 def num_tiles_for_zoom(zoom):
     """Calculate number of tiles at a given zoom level."""
-    return 2 ** (zoom * 2)
+    return 1 << (zoom * 2)
 
 def total_tiles(min_zoom, max_zoom):
     """Calculate total number of tiles across zoom levels."""
@@ -41,17 +57,40 @@ def format_size(bytes):
         bytes /= 1024
     return f"{bytes:.2f} TB"
 
-def download_tile(z, x, y, output_dir, retry=3):
-    """Download a single tile with retry logic."""
-    # Create directory structure
-    tile_dir = output_dir / str(z) / str(x)
-    tile_dir.mkdir(parents=True, exist_ok=True)
+def scan_existing_tiles(output_dir):
+    """Walk the tile tree once and return the set of (z, x, y) on disk.
 
-    tile_path = tile_dir / f"{y}.png"
+    One scandir pass replaces the two stat syscalls (mkdir + exists) that
+    every tile otherwise pays on resume runs.
+    """
+    existing = set()
+    try:
+        with os.scandir(output_dir) as z_dirs:
+            for z_dir in z_dirs:
+                if not z_dir.is_dir() or not z_dir.name.isdigit():
+                    continue
+                z = int(z_dir.name)
+                with os.scandir(z_dir.path) as x_dirs:
+                    for x_dir in x_dirs:
+                        if not x_dir.is_dir() or not x_dir.name.isdigit():
+                            continue
+                        x = int(x_dir.name)
+                        with os.scandir(x_dir.path) as y_files:
+                            for y_file in y_files:
+                                name = y_file.name
+                                if name.endswith('.png') and name[:-4].isdigit():
+                                    existing.add((z, x, int(name[:-4])))
+    except FileNotFoundError:
+        pass
+    return existing
 
-    # Skip if already downloaded
-    if tile_path.exists():
-        return True, 0
+def download_tile(z, x, y, output_dir, retry=3):
+    """Download a single tile with retry logic.
+
+    The caller is responsible for the z/x directory existing and for
+    skipping tiles already on disk (see the single scan in download_tiles).
+    """
+    tile_path = output_dir / str(z) / str(x) / f"{y}.png"
 
     # Build URL
     url = TILE_SERVER.format(z=z, x=x, y=y)
@@ -59,17 +98,30 @@ def download_tile(z, x, y, output_dir, retry=3):
     # Download with retries
     for attempt in range(retry):
         try:
-            request = Request(url, headers={'User-Agent': USER_AGENT})
-            with urlopen(request, timeout=10) as response:
-                tile_data = response.read()
-
-            # Save tile
-            with open(tile_path, 'wb') as f:
-                f.write(tile_data)
+            if _CLIENT is not None:
+                response = _CLIENT.get(url)
+                response.raise_for_status()
+                tile_data = response.content
+            else:
+                request = Request(url, headers={'User-Agent': USER_AGENT})
+                with urlopen(request, timeout=10) as response:
+                    tile_data = response.read()
+
+            # Save tile: raw os.open/os.write skips the Python file-object
+            # layer (noticeable over tens of thousands of ~10KB tiles), and
+            # the tmp + rename keeps interrupted runs from leaving
+            # half-written tiles that the resume scan would then skip.
+            tmp_path = f"{tile_path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, tile_data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, tile_path)
 
             return True, len(tile_data)
 
-        except (HTTPError, URLError) as e:
+        except Exception as e:
             if attempt < retry - 1:
                 time.sleep(1 * (attempt + 1))  # Exponential backoff
                 continue
@@ -91,22 +143,51 @@ def download_tiles(min_zoom, max_zoom, output_dir, skip_existing=True):
     print(f"🌐 Tile server: {TILE_SERVER.split('/')[2]}")
     print()
 
+    # One pass over the tile tree up front instead of an exists() stat per
+    # tile; on an 87k-tile resume run that's one directory walk vs 174k
+    # syscalls.
+    existing = scan_existing_tiles(output_dir) if skip_existing else set()
+
     downloaded = 0
     skipped = 0
     failed = 0
     total_bytes = 0
+    current = 0
     start_time = time.time()
 
     for z in range(min_zoom, max_zoom + 1):
-        tiles_at_zoom = 2 ** z
+        tiles_at_zoom = 1 << z
         print(f"📍 Zoom {z}: {num_tiles_for_zoom(z):,} tiles ({tiles_at_zoom}x{tiles_at_zoom} grid)")
 
         zoom_downloaded = 0
         zoom_bytes = 0
 
+        # Precreate every z/x directory for this zoom in one pass so the
+        # workers never mkdir.
         for x in range(tiles_at_zoom):
-            for y in range(tiles_at_zoom):
-                success, size = download_tile(z, x, y, output_dir)
+            (output_dir / str(z) / str(x)).mkdir(parents=True, exist_ok=True)
+
+        pending = [
+            (x, y)
+            for x in range(tiles_at_zoom)
+            for y in range(tiles_at_zoom)
+            if (z, x, y) not in existing
+        ]
+        zoom_skipped = num_tiles_for_zoom(z) - len(pending)
+        skipped += zoom_skipped
+        current += zoom_skipped
+
+        # Fan the fetches out across the pool; counters are only touched
+        # here in the main thread as futures complete, so no lock is needed.
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(download_tile, z, x, y, output_dir)
+                for x, y in pending
+            ]
+
+            for future in as_completed(futures):
+                success, size = future.result()
+                current += 1
 
                 if success:
                     if size > 0:
@@ -120,7 +201,6 @@ def download_tiles(min_zoom, max_zoom, output_dir, skip_existing=True):
                     failed += 1
 
                 # Progress indicator
-                current = sum(num_tiles_for_zoom(zz) for zz in range(min_zoom, z)) + (x * tiles_at_zoom) + y + 1
                 if current % 100 == 0 or current == total:
                     elapsed = time.time() - start_time
                     percent = (current / total) * 100
@@ -0,0 +1,37 @@
+-- Upgrade an existing locate_jobs table to the current model:
+--
+--   * timestamp columns become TIMESTAMPTZ (the service now binds
+--     timezone-aware datetimes, which asyncpg rejects against plain
+--     TIMESTAMP columns);
+--   * the listing/filtering indexes added to the model (create_all only
+--     creates them on brand-new tables).
+--
+-- Fresh databases do not need this file: init_db's create_all produces the
+-- final schema directly. Apply with:
+--
+--   psql "$DATABASE_URL" -f 001_timestamptz_and_indexes.sql
+--
+-- Existing naive timestamps were written in UTC, so the conversion pins
+-- them to UTC rather than the server's local timezone.
+
+BEGIN;
+
+ALTER TABLE locate_jobs
+    ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE 'UTC',
+    ALTER COLUMN started_at TYPE TIMESTAMPTZ USING started_at AT TIME ZONE 'UTC',
+    ALTER COLUMN completed_at TYPE TIMESTAMPTZ USING completed_at AT TIME ZONE 'UTC';
+
+COMMIT;
+
+-- Index creation is kept outside the transaction so it can run
+-- CONCURRENTLY (no write lock on a busy table).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_locate_jobs_created_at
+    ON locate_jobs (created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_locate_jobs_status_created
+    ON locate_jobs (status, created_at);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_locate_jobs_pending
+    ON locate_jobs (created_at)
+    WHERE status = 'pending';
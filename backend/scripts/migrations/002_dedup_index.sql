@@ -0,0 +1,11 @@
+-- Index for create_job's duplicate-results lookup (filename, top_k,
+-- status): without it every upload pays a sequential scan plus sort over
+-- locate_jobs.
+--
+-- Fresh databases do not need this file: init_db's create_all produces the
+-- final schema directly. Apply with:
+--
+--   psql "$DATABASE_URL" -f 002_dedup_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_locate_jobs_dedup
+    ON locate_jobs (filename, top_k, status);
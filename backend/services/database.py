@@ -7,7 +7,7 @@ Provides async SQLAlchemy session management for job queue persistence.
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
-from .config import DATABASE_URL
+from ..config import DATABASE_URL
 
 
 class Base(DeclarativeBase):
@@ -15,8 +15,20 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
-engine = create_async_engine(DATABASE_URL, echo=False)
+# Create async engine with an explicitly sized pool and asyncpg statement
+# caching. The defaults (5 connections, no pre-ping, unlimited lifetime,
+# 100-entry statement cache) leave connection setup and PREPARE on the hot
+# path under concurrent uploads; with these settings the parameterized job
+# queries reuse pooled connections and cached prepared plans.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    connect_args={"statement_cache_size": 500, "prepared_statement_cache_size": 500},
+)
 
 # Session factory
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
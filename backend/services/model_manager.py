@@ -22,7 +22,9 @@ class GeoClipModelManager:
     def __init__(self, idle_timeout: int = DEFAULT_IDLE_TIMEOUT):
         self._predictor: Optional[Any] = None
         self._last_used: float = 0
+        self._base_timeout = idle_timeout
         self._timeout = idle_timeout
+        self._unloaded_at: float = 0
         self._lock = threading.RLock()
         self._running = True
         self._device = os.getenv("DEVICE", "auto")
@@ -49,6 +51,7 @@ class GeoClipModelManager:
     def _unload(self):
         self._predictor = None
         self._last_used = 0
+        self._unloaded_at = time.time()
         gc.collect()
         
         try:
@@ -67,9 +70,25 @@ class GeoClipModelManager:
             
             if self._predictor is None:
                 from ..llocale import GeoClipPredictor
+
+                # A reload shortly after an unload means the timeout is too
+                # aggressive for the current workload — each reload pays tens
+                # of seconds of weight transfer. Back the timeout off (up to
+                # 8x base) instead of thrashing; a reload after a long quiet
+                # spell resets it.
+                now = time.time()
+                if self._unloaded_at and now - self._unloaded_at < self._base_timeout:
+                    self._timeout = min(self._timeout * 2, self._base_timeout * 8)
+                    logger.info(f"Frequent reloads detected, idle timeout now {self._timeout}s")
+                else:
+                    self._timeout = self._base_timeout
+
                 logger.info(f"Loading GeoCLIP predictor (device={self._device})")
                 start = time.time()
                 self._predictor = GeoClipPredictor(device=self._device)
+                # Pay the torch.compile trace cost now rather than on the
+                # first queued job.
+                self._predictor.warmup()
                 logger.info(f"GeoCLIP loaded in {time.time() - start:.1f}s")
             
             return self._predictor
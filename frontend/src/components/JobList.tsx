@@ -27,7 +27,8 @@ export default function JobList() {
         queryKey: ['locate-jobs'],
         queryFn: async () => {
             const res = await fetch('/api/jobs')
-            return res.json()
+            const body: { jobs: GeolocationJob[]; next_cursor: string | null } = await res.json()
+            return body.jobs
         },
         refetchInterval: 3000,
     })